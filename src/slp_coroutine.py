@@ -40,25 +40,36 @@ to (asynchronous) generators and decorators.
 import sys
 import collections.abc
 import functools
+import inspect
 import types
 import threading
 import contextlib
 import stackless
 
 
-__all__ = ('new_generator_coroutine', 'as_coroutinefunction', 'new_coroutine', 'await_coroutine', 'generator', 'async_generator')
+__all__ = ('new_generator_coroutine', 'as_coroutinefunction', 'new_coroutine', 'never_awaits', 'await_coroutine', 'generator', 'async_generator')
 
 _AWAIT = object()  # sentinel
 
+# Bound once at import time. new_generator_coroutine() calls the scheduler for every
+# step of the coroutine.
+_stackless_run = stackless.run
+
+# Concrete types checked by await_coroutine() before it falls back to the slower ABC check
+_COROUTINE_TYPES = (types.CoroutineType, types.GeneratorType)
+
 class _TaskletStopIteration(StopIteration):
-    """Signal the end of a tasklet and encapsulate the return value of the tasklet"""
+    """Signal the end of a tasklet"""
     pass
 
 def _run(args):
     # utility function for new_generator_coroutine()
     # The args.pop() trick removes any arguments from this stack frame. This way any non-pickleable
-    # object does not hurt.
-    raise _TaskletStopIteration(args.pop()(*args.pop(), **args.pop()))
+    # object does not hurt. Finally args holds the return value of the callable.
+    # Stackless passes the uncaught _TaskletStopIteration to the main tasklet. This way
+    # stackless.run() returns immediately and does not run other tasklets first.
+    args.append(args.pop()(*args.pop(), **args.pop()))
+    raise _TaskletStopIteration
 
 # This thread local variable counts, how many times the Stackless scheduler (stackless.run()) has been
 # recursively entered by new_generator_coroutine()
@@ -84,12 +95,17 @@ def new_generator_coroutine(callable_, *args, **kwargs):
     * The returned coroutine returns the return value of ``callable(*args, **kwargs)``.
     * The returned coroutine is generator based. See :func:`types.coroutine`.
 
+    The tasklet shares the C-stack of the caller as long as Stackless can soft switch it
+    (see :func:`stackless.enable_softswitch`). Only if *callable_* switches tasklets from within
+    a C function that calls back into Python, Stackless has to copy a part of the C-stack.
+
     :param Callable callable_: the callable to be executed
     :param args: positional arguments for *callable_*
     :param kwargs: keyword arguments for *callable_*
     :returns: a generator-based coroutine that executes ``callable(*args, **kwargs)``
     """
-    tasklet = stackless.tasklet(_run)([kwargs, args, callable_])
+    result = [kwargs, args, callable_]
+    tasklet = stackless.tasklet(_run)(result)
     del callable_
     del args
     del kwargs
@@ -105,11 +121,13 @@ def new_generator_coroutine(callable_, *args, **kwargs):
                 rc = _new_generator_coroutine.runcount
                 _new_generator_coroutine.runcount = 0
                 try:
+                    # Run the awaited coroutine in the context of the tasklet. context_run()
+                    # does not copy the context, it just enters it. Therefore it is cheap.
                     if exception is None:
                         value = tasklet.context_run(wait_for.send, value)
                     else:
                         try:
-                            value = tasklet.context_run(wait_for.throw, *exception)
+                            value = tasklet.context_run(wait_for.throw, exception)
                         finally:
                             exception = None
                 finally:
@@ -117,19 +135,22 @@ def new_generator_coroutine(callable_, *args, **kwargs):
             except StopIteration as ex:
                 wait_for = None
                 value = ex.value
-            except Exception:
+            except Exception as ex:
                 # an error
                 wait_for = None
-                exception = sys.exc_info()
+                exception = ex
                 value = None
 
         if wait_for is None:
             if not tasklet.alive:
                 if exception is not None:
                     try:
-                        raise exception[1].with_traceback(exception[2])
+                        raise exception
                     finally:
                         exception = None
+                if result:
+                    # the tasklet finished outside of this driver
+                    return result.pop()
                 return value
 
             if tasklet.paused:
@@ -140,16 +161,16 @@ def new_generator_coroutine(callable_, *args, **kwargs):
             try:
                 if exception is not None:
                     try:
-                        tasklet.throw(*exception, pending=True)
+                        tasklet.throw(exception, pending=True)
                     finally:
                         exception = None
                 _new_generator_coroutine.runcount += 1
                 try:
-                    stackless.run()
+                    _stackless_run()
                 finally:
                     _new_generator_coroutine.runcount -= 1
-            except _TaskletStopIteration as ex:
-                return ex.value
+            except _TaskletStopIteration:
+                return result.pop()
             except StopIteration as ex:
                 # special case: a generator must not raise StopIteration.
                 # Therefore we mask it as a StopAsyncIteration. This is consistent
@@ -163,7 +184,7 @@ def new_generator_coroutine(callable_, *args, **kwargs):
                 value = None
 
             # test, if tasklet called await_coroutine(...) 
-            if isinstance(value, tuple) and len(value) == 2 and value[0] is _AWAIT:
+            if type(value) is tuple and value and value[0] is _AWAIT:
                 assert tasklet.paused
                 wait_for = value[1]
                 value = None
@@ -181,8 +202,8 @@ def new_generator_coroutine(callable_, *args, **kwargs):
             if tasklet.alive:
                 tasklet.kill()
             raise
-        except Exception:
-            exception = sys.exc_info()
+        except Exception as ex:
+            exception = ex
             value = None
 
 
@@ -205,26 +226,50 @@ def generator(asyncgen):
         raise RuntimeError("Can't call generator() from tasklet " + repr(stackless.current))
     asyncgen = type(asyncgen).__aiter__(asyncgen)
     cls = type(asyncgen)
+    anext = cls.__anext__
+    # plain asynchronous iterators lack the methods of an asynchronous generator
+    asend = getattr(cls, 'asend', None)
+    athrow = getattr(cls, 'athrow', None)
+    aclose = getattr(cls, 'aclose', None)
     # first method is always __anext__
-    method = cls.__anext__
-    value = ()
+    method = anext
+    value = None
     while True:
         try:
-            value = stackless.schedule_remove((_AWAIT, method(asyncgen, *value)))
+            if method is anext:
+                value = stackless.schedule_remove((_AWAIT, anext(asyncgen)))
+            else:
+                value = stackless.schedule_remove((_AWAIT, method(asyncgen, value)))
         except StopAsyncIteration:
             return
         try:
-            value = ((yield value),)
-            method = cls.asend
+            value = yield value
         except GeneratorExit:
-            try:
-                stackless.schedule_remove((_AWAIT, cls.aclose(asyncgen)))
-            except StopAsyncIteration:
-                pass
+            if aclose is not None:
+                try:
+                    stackless.schedule_remove((_AWAIT, aclose(asyncgen)))
+                except StopAsyncIteration:
+                    pass
             raise
-        except Exception:
-            value = sys.exc_info()
-            method = cls.athrow
+        except Exception as ex:
+            if athrow is None:
+                raise
+            value = ex
+            method = athrow
+        else:
+            if asend is not None:
+                method = asend
+            elif value is None:
+                method = anext
+            else:
+                raise TypeError("can't send non-None value to an asynchronous iterator")
+
+
+def _iterator_send(iterator, value):
+    # utility function for async_generator(): the send() method of a plain iterator
+    if value is not None:
+        raise TypeError("can't send non-None value to an iterator")
+    return type(iterator).__next__(iterator)
 
 
 async def async_generator(generator):
@@ -236,22 +281,22 @@ async def async_generator(generator):
     :param generator: a generator or iterator object
     :returns: an asynchronous generator iterator
     """
+    gtype = type(generator)
+    # plain iterators lack the methods of a generator
+    send = getattr(gtype, 'send', _iterator_send)
+    throw = getattr(gtype, 'throw', None)
+    close = getattr(gtype, 'close', None)
     value = None
     exception = None
     while True:
         try:
             if exception is None:
-                try:
-                    m = type(generator).send
-                except AttributeError:
-                    if value is not None:
-                        raise
-                    value = await new_generator_coroutine(type(generator).__next__, generator)
-                else:
-                    value = await new_generator_coroutine(m, generator, value)
+                value = await new_generator_coroutine(send, generator, value)
             else:
                 try:
-                    value = await new_generator_coroutine(type(generator).throw, generator, *exception)
+                    if throw is None:
+                        raise exception
+                    value = await new_generator_coroutine(throw, generator, exception)
                 finally:
                     exception = None
         except StopAsyncIteration as ex:
@@ -264,11 +309,12 @@ async def async_generator(generator):
             value = yield value
         except GeneratorExit:
             value = None
-            await new_generator_coroutine(type(generator).close, generator)
+            if close is not None:
+                await new_generator_coroutine(close, generator)
             raise
-        except Exception:
+        except Exception as ex:
             value = None
-            exception = sys.exc_info()
+            exception = ex
 
 
 class contextmanager:
@@ -277,17 +323,27 @@ class contextmanager:
     This *with* statement context manager delegates to an asynchronous context manager
     to actually manage the context.
     """
+    __slots__ = ('async_contextmanager', '_aexit')
+
     def __init__(self, async_contextmanager):
         """
         :param async_contextmanager: the asynchronous context manager to delegate to
         """
         self.async_contextmanager = async_contextmanager
+        self._aexit = None
 
     def __enter__(self):
-        return await_coroutine(type(self.async_contextmanager).__aenter__(self.async_contextmanager))
+        cls = type(self.async_contextmanager)
+        # like the async with statement, look up __aexit__ before calling __aenter__
+        self._aexit = cls.__aexit__
+        return await_coroutine(cls.__aenter__(self.async_contextmanager))
 
     def __exit__(self, exc_type, exc_value, traceback):
-        return await_coroutine(type(self.async_contextmanager).__aexit__(self.async_contextmanager, exc_type, exc_value, traceback))
+        aexit = self._aexit
+        if aexit is None:
+            # __enter__ has not been called
+            aexit = type(self.async_contextmanager).__aexit__
+        return await_coroutine(aexit(self.async_contextmanager, exc_type, exc_value, traceback))
 
 contextlib.AbstractContextManager.register(contextmanager)  # @UndefinedVariable
 
@@ -296,8 +352,10 @@ class asynccontextmanager:
     """An asynchronous context manager, that delegates to a *with* statement context manager.
 
     This asynchronous context manager delegates to a synchronous *with* statement context manager
-    to actually manage the context.
+    to actually manage the context. If the methods ``__enter__`` or ``__exit__`` of the context
+    manager are marked with :func:`never_awaits`, they are called directly instead of in a new tasklet.
     """
+    __slots__ = ('contextmanager',)
 
     def __init__(self, contextmanager):
         """
@@ -306,10 +364,16 @@ class asynccontextmanager:
         self.contextmanager = contextmanager
 
     async def __aenter__(self):
-        return await new_generator_coroutine(type(self.contextmanager).__enter__, self.contextmanager)
+        enter = type(self.contextmanager).__enter__
+        if not getattr(enter, '_might_await', True):
+            return await _call_never_awaits(enter, (self.contextmanager,), {})
+        return await new_generator_coroutine(enter, self.contextmanager)
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        return await new_generator_coroutine(type(self.contextmanager).__exit__, self.contextmanager, exc_type, exc_value, traceback)
+        exit_ = type(self.contextmanager).__exit__
+        if not getattr(exit_, '_might_await', True):
+            return await _call_never_awaits(exit_, (self.contextmanager, exc_type, exc_value, traceback), {})
+        return await new_generator_coroutine(exit_, self.contextmanager, exc_type, exc_value, traceback)
 
 contextlib.AbstractAsyncContextManager.register(asynccontextmanager)  # @UndefinedVariable
 
@@ -321,22 +385,110 @@ def as_coroutinefunction(callable_):
     *coroutine function* from any normal function, method or other
     callable.
 
+    If *callable_* has been marked with :func:`never_awaits`, the coroutine function
+    calls *callable_* directly instead of executing it in a new tasklet.
+
     :param Callable callable_: the callable to be decorated
     :returns: a coroutine function
     """
+    if not getattr(callable_, '_might_await', True):
+        @functools.wraps(callable_)
+        async def coro(*args, **kwargs):
+            try:
+                return callable_(*args, **kwargs)
+            except StopIteration as ex:
+                # same as new_generator_coroutine()
+                raise StopAsyncIteration() from ex
+        return coro
+
+    coro = _new_specialised_coroutinefunction(callable_)
+    if coro is not None:
+        return functools.wraps(callable_)(coro)
+
     @functools.wraps(callable_)
     async def coro(*args, **kwargs):
         return await new_generator_coroutine(callable_, *args, **kwargs)
     return coro
 
 
+_SPECIALISED_COROUTINEFUNCTION_TEMPLATE = """\
+def factory(new_generator_coroutine, callable_):
+    async def coro({0}):
+        return await new_generator_coroutine(callable_, {0})
+    return coro
+"""
+
+def _new_specialised_coroutinefunction(callable_):
+    # utility function for as_coroutinefunction()
+    # If all parameters of callable_ are positional-or-keyword parameters without
+    # a default, create a coroutine function, that does not need to pack its arguments
+    # into *args and **kwargs. Otherwise return None.
+    try:
+        # Don't follow __wrapped__: a decorator may change the arguments of the wrapped function
+        parameters = inspect.signature(callable_, follow_wrapped=False).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    names = []
+    for p in parameters:
+        if (p.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD or p.default is not inspect.Parameter.empty or
+                p.name in ('new_generator_coroutine', 'callable_')):
+            return None
+        names.append(p.name)
+    namespace = {}
+    code = compile(_SPECIALISED_COROUTINEFUNCTION_TEMPLATE.format(', '.join(names)),
+                   '<slp_coroutine as_coroutinefunction>', 'exec')
+    exec(code, globals(), namespace)
+    return namespace['factory'](new_generator_coroutine, callable_)
+
+
 def new_coroutine(callable_, *args, **kwargs):
     """Run any Python callable as coroutine.
 
     Same as :func:`new_generator_coroutine`, but return a coroutine
     created by a *async def* coroutine function.
     """
-    return as_coroutinefunction(callable_)(*args, **kwargs)
+    # Avoid the costs of creating and decorating a new coroutine function
+    if not getattr(callable_, '_might_await', True):
+        coro = _call_never_awaits(callable_, args, kwargs)
+    else:
+        coro = _await_new_generator_coroutine(callable_, args, kwargs)
+    for attr in ('__name__', '__qualname__'):
+        try:
+            value = getattr(callable_, attr)
+        except AttributeError:
+            pass
+        else:
+            setattr(coro, attr, value)
+    return coro
+
+
+async def _await_new_generator_coroutine(callable_, args, kwargs):
+    # utility function for new_coroutine()
+    return await new_generator_coroutine(callable_, *args, **kwargs)
+
+
+async def _call_never_awaits(callable_, args, kwargs):
+    # utility function for new_coroutine() and asynccontextmanager
+    try:
+        return callable_(*args, **kwargs)
+    except StopIteration as ex:
+        # same as new_generator_coroutine()
+        raise StopAsyncIteration() from ex
+
+
+def never_awaits(callable_):
+    """Mark a function, that never awaits a coroutine.
+
+    This function is a *decorator*. :func:`as_coroutinefunction` and :func:`new_coroutine`
+    call a marked function directly instead of executing it in a new tasklet.
+    A marked function must neither call :func:`await_coroutine` or :func:`generator` nor
+    switch tasklets.
+
+    :param Callable callable_: the function to be marked
+    :returns: *callable_*
+    """
+    callable_._might_await = False
+    return callable_
 
 
 def await_coroutine(coroutine):
@@ -353,7 +505,8 @@ def await_coroutine(coroutine):
     """
     if not _new_generator_coroutine.runcount:
         raise RuntimeError("Can't call await_coroutine from tasklet " + repr(stackless.current))
-    if not isinstance(coroutine, (collections.abc.Coroutine, collections.abc.Generator)):
+    if (not isinstance(coroutine, _COROUTINE_TYPES) and
+            not isinstance(coroutine, (collections.abc.Coroutine, collections.abc.Generator))):
         raise TypeError("argument is neither a coroutine nor a generator")
     return stackless.schedule_remove((_AWAIT, coroutine))
 
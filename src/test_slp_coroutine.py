@@ -27,6 +27,7 @@ import inspect
 import stackless
 import contextvars
 import contextlib
+import functools
 
 from slp_coroutine import *
 from slp_coroutine import _new_generator_coroutine
@@ -137,6 +138,35 @@ class Test(unittest.TestCase):
         self.assertEqual(coro.__qualname__, foo.__qualname__)
         coro.close()
         
+    def test_new_coroutine_10(self):
+        @never_awaits
+        def foo(arg):
+            return (arg, stackless.current)
+
+        coro = new_coroutine(foo, 10)
+        self.assertIsInstance(coro, types.CoroutineType)
+        self.assertEqual(coro.__qualname__, foo.__qualname__)
+        result = run_async(coro)
+        self.assertEqual(result, ([], (10, stackless.current)))
+
+    def test_new_coroutine_11(self):
+        steps = []
+        def bar():
+            steps.append('bar')
+
+        def foo():
+            return stackless.tasklet(bar)()
+
+        result = run_async(new_coroutine(foo))
+        other = result[1]
+        try:
+            # the coroutine returns without running the other runnable tasklet
+            self.assertEqual(result[0], [])
+            self.assertTrue(other.alive)
+            self.assertListEqual(steps, [])
+        finally:
+            other.kill()
+
     def test_as_coroutinefunction_1(self):
         self.assertTrue(inspect.isfunction(as_coroutinefunction))
 
@@ -163,6 +193,71 @@ class Test(unittest.TestCase):
         result = run_async(foo(10, arg2='blubber'))
         self.assertEqual(result, ([], (10, 'blubber')))
 
+    def test_as_coroutinefunction_4(self):
+        @as_coroutinefunction
+        @never_awaits
+        def foo(arg):
+            return (arg, stackless.current)
+
+        self.assertTrue(inspect.iscoroutinefunction(foo))
+        result = run_async(foo(13))
+        self.assertEqual(result, ([], (13, stackless.current)))
+
+    def test_as_coroutinefunction_5(self):
+        @as_coroutinefunction
+        def foo(arg, arg2=14, *args, kw, **kwargs):
+            return (arg, arg2, args, kw, kwargs)
+
+        result = run_async(foo(10, 11, 12, kw=13, x=15))
+        self.assertEqual(result, ([], (10, 11, (12,), 13, {'x': 15})))
+        result = run_async(foo(10, kw=13))
+        self.assertEqual(result, ([], (10, 14, (), 13, {})))
+
+    def test_as_coroutinefunction_6(self):
+        @never_awaits
+        def foo():
+            raise StopIteration(16)
+
+        for coro in (as_coroutinefunction(foo)(), new_coroutine(foo)):
+            with self.assertRaises(StopAsyncIteration) as cm:
+                run_async(coro)
+            self.assertIsInstance(cm.exception.__cause__, StopIteration)
+            self.assertEqual(cm.exception.__cause__.value, 16)
+
+    def test_as_coroutinefunction_7(self):
+        def foo(arg, arg2):
+            return (arg, arg2)
+
+        def bar(callable_, new_generator_coroutine):
+            return (callable_, new_generator_coroutine)
+
+        # foo gets a specialised coroutine function
+        coro_foo = as_coroutinefunction(foo)
+        self.assertEqual(list(inspect.signature(coro_foo, follow_wrapped=False).parameters), ['arg', 'arg2'])
+        self.assertEqual(run_async(coro_foo(10, arg2=17)), ([], (10, 17)))
+        self.assertEqual(coro_foo.__code__.co_filename, '<slp_coroutine as_coroutinefunction>')
+
+        # the parameter names of bar are reserved, bar gets the generic coroutine function
+        coro_bar = as_coroutinefunction(bar)
+        self.assertEqual(list(inspect.signature(coro_bar, follow_wrapped=False).parameters), ['args', 'kwargs'])
+        self.assertEqual(run_async(coro_bar(18, new_generator_coroutine=19)), ([], (18, 19)))
+
+    def test_as_coroutinefunction_8(self):
+        def inject_arg(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, 20, **kwargs)
+            return wrapper
+
+        @as_coroutinefunction
+        @inject_arg
+        def foo(arg, injected):
+            return (arg, injected)
+
+        self.assertEqual(list(inspect.signature(foo, follow_wrapped=False).parameters), ['args', 'kwargs'])
+        result = run_async(foo(21))
+        self.assertEqual(result, ([], (21, 20)))
+
     def test_await_coroutine_1(self):
         @types.coroutine
         def bar(arg, arg2):
@@ -305,6 +400,25 @@ class Test(unittest.TestCase):
             run_async(coro)
         self.assertEqual(result, [0, 26, 26, cm.exception])
 
+    def test_generator_5(self):
+        class AsyncIterator:
+            def __init__(self, *args):
+                self.values = list(args)
+            def __aiter__(self):
+                return self
+            async def __anext__(self):
+                if not self.values:
+                    raise StopAsyncIteration()
+                return self.values.pop(0)
+
+        def foo(*args):
+            return tuple(generator(AsyncIterator(*args)))
+
+        arg = (27, 28, 29)
+        coro = new_coroutine(foo, *arg)
+        result = run_async(coro)
+        self.assertEqual(result, ([], arg))
+
     def test_async_generator_1(self):
         def gen():
             yield 1
@@ -372,6 +486,19 @@ class Test(unittest.TestCase):
             run_async(coro())
         self.assertEqual(result, [0, 36, 36, cm.exception])
 
+    def test_async_generator_5(self):
+        async def coro():
+            res = []
+            ag = async_generator(iter((1, 2)))
+            async for i in ag:
+                res.append(i)
+                break
+            await ag.aclose()
+            return res
+
+        result = run_async(coro())
+        self.assertEqual(result, ([], [1]))
+
     def test_contextmanager_1(self):
         @contextlib.asynccontextmanager
         async def ascmgr():
@@ -403,6 +530,22 @@ class Test(unittest.TestCase):
         self.assertListEqual(steps, [1, (2,4), 3])
         self.assertEqual(result, ([], None))
 
+    def test_contextmanager_3(self):
+        steps = []
+        class AsyncCmgr:
+            async def __aenter__(self):
+                raise AssertionError('must not run')
+            async def __aexit__(self, exc_type, exc_value, traceback):
+                steps.append(exc_type)
+
+        def func():
+            context_manager = slp_coroutine.contextmanager(AsyncCmgr())
+            context_manager.__exit__(None, None, None)
+
+        result = run_async(new_coroutine(func))
+        self.assertListEqual(steps, [None])
+        self.assertEqual(result, ([], None))
+
     def test_asynccontextmanager_1(self):
         @contextlib.contextmanager
         def cmgr():
@@ -433,6 +576,42 @@ class Test(unittest.TestCase):
         self.assertListEqual(steps, [1, (2,4), 3])
         self.assertEqual(result, ([], None))
 
+    def test_asynccontextmanager_3(self):
+        steps = []
+        class Cmgr:
+            @never_awaits
+            def __enter__(self):
+                steps.append(stackless.current)
+                return 1
+            @never_awaits
+            def __exit__(self, exc_type, exc_value, traceback):
+                steps.append(stackless.current)
+
+        async def func():
+            async with slp_coroutine.asynccontextmanager(Cmgr()) as value:
+                steps.append(value)
+
+        result = run_async(func())
+        self.assertListEqual(steps, [stackless.current, 1, stackless.current])
+        self.assertEqual(result, ([], None))
+
+    def test_asynccontextmanager_4(self):
+        class Cmgr:
+            @never_awaits
+            def __enter__(self):
+                raise StopIteration(30)
+            @never_awaits
+            def __exit__(self, exc_type, exc_value, traceback):
+                raise StopIteration(31)
+
+        context_manager = slp_coroutine.asynccontextmanager(Cmgr())
+        for coro, value in ((context_manager.__aenter__(), 30),
+                            (context_manager.__aexit__(None, None, None), 31)):
+            with self.assertRaises(StopAsyncIteration) as cm:
+                run_async(coro)
+            self.assertIsInstance(cm.exception.__cause__, StopIteration)
+            self.assertEqual(cm.exception.__cause__.value, value)
+
     def test_context_1(self):
 
         @types.coroutine